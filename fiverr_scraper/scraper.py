@@ -1,17 +1,37 @@
 import selenium.webdriver as webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
+import soupsieve as sv
 import time
 import random
 import logging
+import re
 import csv
 import json
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import orjson # Optional: much faster JSON encoder. Falls back to the stdlib json module if missing.
+except ImportError:
+    orjson = None
 import os
+import gzip
+import hashlib
+import multiprocessing
+import queue
+import threading
+from contextlib import contextmanager, nullcontext
+from multiprocessing.util import Finalize
 from datetime import datetime
-import pandas as pd
-import argparse # Added for command-line argument parsing
+from functools import lru_cache
+import argparse
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
@@ -29,14 +49,143 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/109.0"
 ]
-PAGE_LOAD_WAIT_SECONDS = random.uniform(8, 12)  # Time to wait for page to load its dynamic content.
+PAGE_LOAD_TIMEOUT_SECONDS = 12                  # Maximum time to wait for gig cards (or a "no results" message) to render.
+PAGE_LOAD_POLL_SECONDS = 0.1                    # How often to check for gig cards while waiting (Selenium's default is 0.5).
+POST_RENDER_JITTER_MIN = 0.3                    # Minimum random pause after the page renders, before reading it (seconds).
+POST_RENDER_JITTER_MAX = 1.2                    # Maximum random pause after the page renders, before reading it (seconds).
 MIN_INTER_PAGE_DELAY = 5                        # Minimum delay between fetching subsequent pages (seconds).
 MAX_INTER_PAGE_DELAY = 10                       # Maximum delay between fetching subsequent pages (seconds).
 OUTPUT_DIR = "output"                           # Directory to save scraped data.
+CACHE_DIR = os.path.join(OUTPUT_DIR, ".cache")  # Directory for cached search result pages (gzipped HTML).
+CACHE_TTL_SECONDS = 6 * 60 * 60                 # Cached pages older than this are fetched again.
+CHROMEDRIVER_PATH_FILE = os.path.join(OUTPUT_DIR, ".chromedriver_path") # Remembers the resolved ChromeDriver between runs.
 MAX_PAGES_TO_SCRAPE = 2                         # Maximum number of pages to scrape per keyword. Set to a low number for testing.
+WORKER_PROCESSES = 4                            # Number of worker processes (one headless Chrome each) fetching pages concurrently.
+POOL_SIZE = 1                                   # WebDriver instances per BrowserPool; a worker process fetches one page at a time, so it never needs more than one.
+MAX_USES_PER_INSTANCE = 50                      # Page fetches after which a pooled WebDriver is quit and replaced.
 RETRY_ATTEMPTS = 3                              # Number of retry attempts for fetching a page.
 RETRY_WAIT_MIN_SECONDS = 2                      # Minimum wait time for exponential backoff retry.
 RETRY_WAIT_MAX_SECONDS = 6                      # Maximum wait time for exponential backoff retry.
+FAST_FETCH_TIMEOUT_SECONDS = 10                 # Timeout for the plain-HTTP fetch tried before falling back to Selenium.
+GIG_CARD_CSS_SELECTOR = 'div[data-testid="gig-card-layout"]'    # Element whose presence means results have rendered.
+NO_RESULTS_XPATH = "//*[contains(text(),'No services found')]"  # Element whose presence means there are no results.
+NO_RESULTS_TEXT = 'No services found for your search'           # Message Fiverr renders on a search with no results.
+# Elements marking a "no results" or error page. Evaluated in the browser, so these pages never need page_source.
+ERROR_PAGE_XPATH = (
+    "//*[@data-testid='search-zero-results' or @data-testid='error-state'"
+    f" or text()[contains(., '{NO_RESULTS_TEXT}')]"
+    " or text()[contains(., 'Hmm, something seems to have gone wrong')]]"
+)
+EMPTY_PAGE_HTML = "<html><body></body></html>"  # Returned by get_page_html for "no results" / error pages.
+# Keys of every gig dict produced by parse_gigs, in CSV column order.
+_CSV_COLUMNS = ("title", "seller_name", "seller_level", "seller_country", "price", "rating", "num_reviews", "gig_url")
+
+# Precompiled patterns used by clean_gig_fields. Each needs a capture group for Series.str.extract.
+_PRICE_RE = re.compile(r'([\d\.,]+)')         # Sequences of digits, dots, or commas.
+_REVIEWS_RE = re.compile(r'([\d\.]+)(k?)')    # A number, optionally followed by 'k'.
+_RATING_RE = re.compile(r'([\d\.]+)')         # Sequences of digits or dots.
+_REVIEWS_STRIP_RE = re.compile(r'[(),]')       # Characters removed from review counts before matching.
+_GIG_CARD_RE = re.compile(r'data-testid="gig-card-layout"|class="(?:[^"]*\s)?gig-card(?![\w-])')  # Cheap check for gig card markup.
+# Gig title links (as matched by _SEL_TITLE: data-testid="gig-title", class gig-title-link or a /gigs/ href),
+# capturing the href path without its query string. Hashed by page_fingerprint.
+_GIG_TITLE_HREF_RE = re.compile(
+    r'<a(?=\s[^>]*(?:data-testid="gig-title"|class="(?:[^"]*\s)?gig-title-link(?![\w-])|href="[^"]*/gigs/))'
+    r'[^>]*?\shref="(?:https://www\.fiverr\.com)?([^"?#]+)'
+)
+
+# Precompiled CSS selectors used by parse_gigs. These are based on observed patterns and may need updates
+# if Fiverr's site structure changes. Compiling once avoids re-parsing each selector string for every card.
+_SEL_GIG_CARDS = sv.compile('div[data-testid="gig-card-layout"], div.gig-card, article.gig-card')
+_SEL_TITLE = sv.compile('a[data-testid="gig-title"], a.gig-title-link, h3 a, a[href*="/gigs/"]')
+_SEL_SELLER = sv.compile('a[data-testid="seller-name"], a[href*="/users/"], p.seller-name')
+_SEL_LEVEL = sv.compile('span[data-testid="seller-level"], span.seller-level')
+_SEL_SELLER_COUNTRY = sv.compile('span[data-testid*="country"], span[class*="country"], span[class*="location"]')
+_SEL_COUNTRY = sv.compile('span[data-testid*="country"], span[class*="country"], span[class*="location"], div.seller-location span')
+_SEL_FLAG = sv.compile('img[class*="flag"], span[class*="flag-icon"]')
+_SEL_PRICE = sv.compile('span[data-testid="price"], p.price, span[class*="price"]')
+_SEL_RATING_AREA = sv.compile('div[data-testid="gig-rating"], span[class*="rating"], div[class*="rating"]')
+_SEL_AREA_RATING = sv.compile('span[data-testid="star-rating-score"], span.rating-score, b') # 'b' tag for bolded rating
+_SEL_RATING = sv.compile('span[data-testid="star-rating-score"], span.rating-score, b[class*="rating"]')
+_SEL_REVIEWS = sv.compile('span[data-testid="review-count"], span.rating-count, span[class*="reviews"]')
+
+# HTTP session for the plain-HTTP fast path. Reused for every request so connections (and their TLS
+# handshakes) to fiverr.com are kept alive across pages.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=20, max_retries=Retry(total=3, backoff_factor=1)))
+
+# Resolved ChromeDriver binary path, memoized so it is looked up at most once per process.
+_chromedriver_path = None
+# Manager lock serializing ChromeDriver re-resolution across pool workers. Set by _init_worker; None in the parent process.
+_chromedriver_refresh_lock = None
+# BrowserPool owned by the current pool worker process. Set by _init_worker; None in the parent process.
+_browser_pool = None
+# Whether pool workers should bypass the page cache. Set by _init_worker from --force-rescrape.
+_force_rescrape = False
+# Fingerprints of pages seen this run (fingerprint -> lowest page number with that content), shared by
+# all workers through a multiprocessing.Manager dict, and the Manager lock guarding it. Set by _init_worker.
+_seen_fingerprints = None
+_fingerprint_lock = None
+
+def build_search_url(keyword: str, page_number: int) -> str:
+    """
+    Builds the Fiverr search results URL for a keyword and page number.
+
+    Args:
+        keyword: The search term to use on Fiverr.
+        page_number: The page number of the search results.
+
+    Returns:
+        The search results URL. Also used as the page cache key.
+    """
+    if page_number == 1:
+        return f"https://www.fiverr.com/search/gigs?query={keyword}"
+    return f"https://www.fiverr.com/search/gigs?query={keyword}&page={page_number}"
+
+def _cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.html.gz")
+
+def load_cached_html(url: str) -> str | None:
+    """
+    Loads a previously fetched page from the on-disk cache.
+
+    Args:
+        url: The search results URL the page was fetched from.
+
+    Returns:
+        The cached HTML, or None if the page isn't cached, is older than CACHE_TTL_SECONDS,
+        or can't be read.
+    """
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL_SECONDS:
+            return None
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError) as e:
+        logger.warning(f"Could not read cached page for {url}: {e}")
+        return None
+
+def store_cached_html(url: str, html_content: str):
+    """
+    Saves a fetched page to the on-disk cache (gzip-compressed, keyed by a hash of the URL).
+
+    Failures are logged and otherwise ignored, since caching is only an optimization.
+
+    Args:
+        url: The search results URL the page was fetched from.
+        html_content: The page HTML.
+    """
+    path = _cache_path(url)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(html_content)
+        os.replace(tmp_path, path) # Atomic, so readers never see a partially written file.
+    except OSError as e:
+        logger.warning(f"Could not cache page for {url}: {e}")
 
 @retry(
     stop=stop_after_attempt(RETRY_ATTEMPTS),
@@ -60,7 +209,7 @@ def get_page_html(driver: webdriver.Chrome, keyword: str, page_number: int) -> s
 
     Returns:
         The HTML content of the page as a string, or None if fetching fails after retries
-        or an unexpected error occurs. Returns a minimal HTML string ("<html><body></body></html>")
+        or an unexpected error occurs. Returns a minimal HTML string (EMPTY_PAGE_HTML)
         if Fiverr indicates no results or an error on their end.
 
     Raises:
@@ -69,27 +218,34 @@ def get_page_html(driver: webdriver.Chrome, keyword: str, page_number: int) -> s
         TimeoutException: If a page load times out and is configured for retry
                           (propagated by tenacity).
     """
-    if page_number == 1:
-        fiverr_search_url = f"https://www.fiverr.com/search/gigs?query={keyword}"
-    else:
-        fiverr_search_url = f"https://www.fiverr.com/search/gigs?query={keyword}&page={page_number}"
+    fiverr_search_url = build_search_url(keyword, page_number)
     
     logger.info(f"Attempting to fetch URL: {fiverr_search_url} (Keyword: '{keyword}', Page: {page_number})")
     
     try:
         driver.get(fiverr_search_url)
-        # Wait for dynamic content to load. This is a simple fixed wait.
-        # More advanced techniques might involve waiting for specific elements to be present.
-        logger.info(f"Waiting for page to load... ({PAGE_LOAD_WAIT_SECONDS:.2f} seconds)")
-        time.sleep(PAGE_LOAD_WAIT_SECONDS)
-        page_html = driver.page_source
-        
-        # Check for common Fiverr messages indicating no results or errors.
-        if "Hmm, something seems to have gone wrong" in page_html or "No services found for your search" in page_html:
+        # Wait only until the first gig card (or Fiverr's "no results" message) is present,
+        # instead of sleeping for a fixed period on every page.
+        logger.info(f"Waiting up to {PAGE_LOAD_TIMEOUT_SECONDS} seconds for gig cards to render...")
+        try:
+            WebDriverWait(driver, PAGE_LOAD_TIMEOUT_SECONDS, poll_frequency=PAGE_LOAD_POLL_SECONDS).until(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, GIG_CARD_CSS_SELECTOR)),
+                EC.presence_of_element_located((By.XPATH, NO_RESULTS_XPATH))
+            ))
+        except TimeoutException:
+            # Neither appeared in time. Fall back to the error-page check below and let parse_gigs decide.
+            logger.warning(f"Timed out after {PAGE_LOAD_TIMEOUT_SECONDS} seconds waiting for gig cards on page {page_number} for '{keyword}'.")
+        # Short random pause, drawn per page, so page timings don't look machine-regular to bot detection.
+        time.sleep(random.uniform(POST_RENDER_JITTER_MIN, POST_RENDER_JITTER_MAX))
+
+        # Check for common Fiverr messages indicating no results or errors with a single element lookup
+        # in the browser, before transferring the (multi-megabyte) page_source from ChromeDriver.
+        if driver.find_elements(By.XPATH, ERROR_PAGE_XPATH):
             logger.warning(f"Page {page_number} for keyword '{keyword}' appears empty or is an error page (e.g., 'No services found').")
             # Return a minimal HTML structure; parse_gigs will handle this by returning an empty list.
-            return "<html><body></body></html>" 
-            
+            return EMPTY_PAGE_HTML
+
+        page_html = driver.page_source
         logger.info(f"Successfully fetched HTML for page {page_number} of keyword '{keyword}'.")
         return page_html
     except (WebDriverException, TimeoutException) as e:
@@ -101,6 +257,187 @@ def get_page_html(driver: webdriver.Chrome, keyword: str, page_number: int) -> s
         logger.error(f"Unexpected error fetching page HTML for keyword '{keyword}' on page {page_number}: {e}", exc_info=True)
         return None # For these errors, don't retry; return None to signal failure.
 
+@lru_cache(maxsize=4096)
+def _normalize_gig_url(gig_url_raw: str) -> str:
+    """
+    Cleans and normalizes a gig URL taken from a card's title link.
+
+    Relative URLs get the base Fiverr URL prepended, and query parameters (e.g. '?source=...')
+    are stripped. Cached, since the same links recur across cards and pages.
+
+    Args:
+        gig_url_raw: The raw href value.
+
+    Returns:
+        The normalized URL, or the raw value unchanged if its format is unexpected.
+    """
+    if gig_url_raw.startswith('/'):
+        return f"https://www.fiverr.com{gig_url_raw.partition('?')[0]}"
+    if gig_url_raw.startswith('http'):
+        return gig_url_raw.partition('?')[0]
+    # Log if an unexpected URL format is encountered.
+    logger.debug(f"Unusual gig URL format: {gig_url_raw}")
+    return gig_url_raw # Store as is if unsure.
+
+def _extract_card_fields(card, card_identifier: str) -> dict | None:
+    """
+    Extracts the details of a single gig card.
+
+    Missing fields are handled with plain None checks and logged at DEBUG level, since this
+    runs for every card on every page.
+
+    Args:
+        card: A BeautifulSoup Tag for one gig card.
+        card_identifier: A label for the card used in log messages (e.g. "Card 3/48").
+
+    Returns:
+        A dictionary with all gig keys present (title, seller_name, seller_level, seller_country,
+        price, num_reviews, rating, gig_url); values that couldn't be found are None or "N/A".
+        Returns None if none of the field selectors match anything in the card.
+    """
+    # Initialize a dictionary for each gig's data to ensure all keys are present.
+    gig_info = {
+        "title": None, "seller_name": None, "seller_level": None, "seller_country": "N/A",
+        "price": None, "num_reviews": None, "rating": None, "gig_url": None
+    }
+
+    # Gig Title and URL extraction
+    # Selects the first link that seems to be the main gig link/title.
+    title_element = _SEL_TITLE.select_one(card)
+    if title_element:
+        gig_info["title"] = title_element.text.strip()
+        gig_url_raw = title_element.get('href')
+        if gig_url_raw:
+            gig_info["gig_url"] = _normalize_gig_url(gig_url_raw)
+    else:
+        logger.debug(f"[{card_identifier}] Title not found.")
+
+    # Seller Name extraction
+    seller_element = _SEL_SELLER.select_one(card)
+    seller_info_container = None # Will try to find a common parent for seller name and country
+    if seller_element:
+        gig_info["seller_name"] = seller_element.text.strip()
+        # Try to find a parent container that might also hold the country
+        # This is a guess; structure varies wildly. Common parents might be 2-3 levels up.
+        seller_info_container = seller_element.find_parent('div', class_=lambda x: x and ('seller-info' in x or 'seller-details' in x)) 
+        if not seller_info_container:
+            seller_info_container = seller_element.parent # Default to direct parent if specific class not found
+    else:
+        logger.debug(f"[{card_identifier}] Seller name not found.")
+
+    # Seller Level extraction (e.g., "Top Rated Seller", "Level Two Seller")
+    seller_level_element = _SEL_LEVEL.select_one(card)
+    if seller_level_element:
+        gig_info["seller_level"] = seller_level_element.text.strip()
+    else:
+        gig_info["seller_level"] = "N/A" 
+
+    # Seller Country Extraction (Hypothetical - MUST BE VERIFIED)
+    # Attempt 1: Look for a specific data-testid or class within the card or seller_info_container
+    country_element = None
+    flag_icon = None
+    if seller_info_container: # Prioritize searching within the assumed seller info block
+         country_element = _SEL_SELLER_COUNTRY.select_one(seller_info_container)
+    if not country_element: # Fallback to searching the whole card
+        country_element = _SEL_COUNTRY.select_one(card)
+    
+    if country_element:
+        country_text = country_element.text.strip()
+        # Sometimes country is prefixed, e.g., "From United States"
+        if country_text.lower().startswith("from "):
+            country_text = country_text[5:].strip()
+        gig_info["seller_country"] = country_text
+    else:
+        # Attempt 2: Look for a 'title' attribute on a flag icon (less likely on search page)
+        flag_icon = _SEL_FLAG.select_one(card)
+        if flag_icon and flag_icon.has_attr('title'):
+            gig_info["seller_country"] = flag_icon['title'].strip()
+        else:
+            logger.debug(f"[{card_identifier}] Seller country not found using common selectors or flag icon title.")
+            # gig_info["seller_country"] remains "N/A" as initialized
+
+    # Price extraction
+    price_element = _SEL_PRICE.select_one(card)
+    if price_element:
+        gig_info["price"] = price_element.text.strip() # Cleaned later by clean_gig_fields.
+    else:
+        logger.debug(f"[{card_identifier}] Price not found.")
+
+    # Rating and Number of Reviews extraction
+    # These are often found together or close by in the HTML.
+    rating_review_area = _SEL_RATING_AREA.select_one(card)
+    if rating_review_area:
+        rating_element = _SEL_AREA_RATING.select_one(rating_review_area)
+        if rating_element:
+            gig_info["rating"] = rating_element.text.strip()
+        else:
+            logger.debug(f"[{card_identifier}] Rating score not found within designated rating area.")
+
+        review_count_element = _SEL_REVIEWS.select_one(rating_review_area)
+        if review_count_element:
+            gig_info["num_reviews"] = review_count_element.text.strip()
+        else:
+            logger.debug(f"[{card_identifier}] Review count not found within designated rating area.")
+    else: 
+        # Fallback if a combined rating/review area isn't found.
+        rating_element = _SEL_RATING.select_one(card)
+        if rating_element:
+            gig_info["rating"] = rating_element.text.strip()
+        else:
+            logger.debug(f"[{card_identifier}] Rating score not found (fallback search).")
+
+        review_count_element = _SEL_REVIEWS.select_one(card)
+        if review_count_element:
+            gig_info["num_reviews"] = review_count_element.text.strip()
+        else:
+            gig_info["num_reviews"] = "0" # Assume 0 reviews if not found.
+
+    # Every selector has been tried only when nothing matched, so this is the "empty card" case.
+    if not (title_element or seller_element or seller_level_element or country_element or flag_icon
+            or price_element or rating_review_area or rating_element or review_count_element):
+        return None
+    return gig_info
+
+def page_fingerprint(html_content: str) -> str | None:
+    """
+    Computes a digest of the result set a page shows, used to detect pages whose results repeat.
+
+    Only the ordered gig title link paths are hashed (query strings such as '?source=...&pos=3'
+    dropped), so pages that differ in counters, request IDs, tracking tokens or timestamps still
+    get the same fingerprint, while header/footer navigation shared by every page is ignored.
+
+    Args:
+        html_content: The HTML content of a page.
+
+    Returns:
+        A hex digest (BLAKE2b, 16 bytes) of the page's gig links, or None if the page has none.
+    """
+    links = _GIG_TITLE_HREF_RE.findall(html_content)
+    if not links:
+        return None
+    return hashlib.blake2b('\n'.join(links).encode('utf-8'), digest_size=16).hexdigest()
+
+def _fetch_fast(url: str) -> str | None:
+    """
+    Fetches a search results page with a plain HTTP request, without starting a browser.
+
+    Args:
+        url: The search results URL.
+
+    Returns:
+        The response body, or None if the request failed or returned a non-200 status.
+    """
+    headers = {'User-Agent': random.choice(USER_AGENTS), 'Accept-Language': 'en-US,en;q=0.9'}
+    try:
+        resp = _SESSION.get(url, headers=headers, timeout=FAST_FETCH_TIMEOUT_SECONDS)
+    except requests.RequestException as e:
+        logger.info(f"Plain HTTP fetch of {url} failed: {e}")
+        return None
+    if resp.status_code != 200:
+        logger.info(f"Plain HTTP fetch of {url} returned status {resp.status_code}.")
+        return None
+    return resp.text
+
 def parse_gigs(html_content: str) -> list[dict]:
     """
     Parses gig information from the HTML content of a Fiverr search results page.
@@ -125,12 +462,11 @@ def parse_gigs(html_content: str) -> list[dict]:
     # and this note serves as the finding of the investigation.
     # Do NOT fetch individual gig pages to find this information, as per constraints.
     # --- END IMPORTANT NOTE ---
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml') # libxml2-backed parser; much faster than 'html.parser' on large pages.
     gigs_data = []
     
-    # Primary CSS selectors for gig cards. These are based on observed patterns and may need updates
-    # if Fiverr's site structure changes. Using `data-testid` is often more robust.
-    gig_cards = soup.select('div[data-testid="gig-card-layout"], div.gig-card, article.gig-card')
+    # Primary CSS selectors for gig cards. Using `data-testid` is often more robust.
+    gig_cards = _SEL_GIG_CARDS.select(soup)
     logger.info(f"Found {len(gig_cards)} potential gig cards using primary selectors.")
 
     if not gig_cards:
@@ -145,123 +481,22 @@ def parse_gigs(html_content: str) -> list[dict]:
         return []
 
     for i, card in enumerate(gig_cards):
-        # Initialize a dictionary for each gig's data to ensure all keys are present.
-        gig_info = {
-            "title": None, "seller_name": None, "seller_level": None, "seller_country": "N/A",
-            "price": None, "num_reviews": None, "rating": None, "gig_url": None
-        }
         card_identifier = f"Card {i+1}/{len(gig_cards)}" # For logging purposes
-
         try:
-            # Gig Title and URL extraction
-            # Selects the first link that seems to be the main gig link/title.
-            title_element = card.select_one('a[data-testid="gig-title"], a.gig-title-link, h3 a, a[href*="/gigs/"]')
-            if title_element:
-                gig_info["title"] = title_element.text.strip()
-                gig_url_raw = title_element.get('href')
-                if gig_url_raw:
-                    # Clean and normalize the URL.
-                    # URLs might be relative, so prepend the base Fiverr URL.
-                    # Also, strip query parameters (e.g., from '?source=...')
-                    if gig_url_raw.startswith('/'):
-                        gig_info["gig_url"] = f"https://www.fiverr.com{gig_url_raw.split('?')[0]}"
-                    elif gig_url_raw.startswith('http'):
-                        gig_info["gig_url"] = gig_url_raw.split('?')[0]
-                    else:
-                        # Log if an unexpected URL format is encountered.
-                        logger.warning(f"[{card_identifier}] Unusual gig URL format: {gig_url_raw}")
-                        gig_info["gig_url"] = gig_url_raw # Store as is if unsure.
-            else:
-                logger.warning(f"[{card_identifier}] Title not found.")
-
-            # Seller Name extraction
-            seller_element = card.select_one('a[data-testid="seller-name"], a[href*="/users/"], p.seller-name')
-            seller_info_container = None # Will try to find a common parent for seller name and country
-            if seller_element:
-                gig_info["seller_name"] = seller_element.text.strip()
-                # Try to find a parent container that might also hold the country
-                # This is a guess; structure varies wildly. Common parents might be 2-3 levels up.
-                seller_info_container = seller_element.find_parent('div', class_=lambda x: x and ('seller-info' in x or 'seller-details' in x)) 
-                if not seller_info_container:
-                    seller_info_container = seller_element.parent # Default to direct parent if specific class not found
-            else:
-                logger.warning(f"[{card_identifier}] Seller name not found.")
-
-            # Seller Level extraction (e.g., "Top Rated Seller", "Level Two Seller")
-            seller_level_element = card.select_one('span[data-testid="seller-level"], span.seller-level')
-            if seller_level_element:
-                gig_info["seller_level"] = seller_level_element.text.strip()
-            else:
-                gig_info["seller_level"] = "N/A" 
-
-            # Seller Country Extraction (Hypothetical - MUST BE VERIFIED)
-            # Attempt 1: Look for a specific data-testid or class within the card or seller_info_container
-            country_element = None
-            if seller_info_container: # Prioritize searching within the assumed seller info block
-                 country_element = seller_info_container.select_one('span[data-testid*="country"], span[class*="country"], span[class*="location"]')
-            if not country_element: # Fallback to searching the whole card
-                country_element = card.select_one('span[data-testid*="country"], span[class*="country"], span[class*="location"], div.seller-location span')
-            
-            if country_element:
-                country_text = country_element.text.strip()
-                # Sometimes country is prefixed, e.g., "From United States"
-                if country_text.lower().startswith("from "):
-                    country_text = country_text[5:].strip()
-                gig_info["seller_country"] = country_text
-            else:
-                # Attempt 2: Look for a 'title' attribute on a flag icon (less likely on search page)
-                flag_icon = card.select_one('img[class*="flag"], span[class*="flag-icon"]')
-                if flag_icon and flag_icon.has_attr('title'):
-                    gig_info["seller_country"] = flag_icon['title'].strip()
-                else:
-                    logger.warning(f"[{card_identifier}] Seller country not found using common selectors or flag icon title.")
-                    # gig_info["seller_country"] remains "N/A" as initialized
-
-            # Price extraction
-            price_element = card.select_one('span[data-testid="price"], p.price, span[class*="price"]')
-            if price_element:
-                gig_info["price"] = clean_price(price_element.text.strip())
-            else:
-                logger.warning(f"[{card_identifier}] Price not found.")
-
-            # Rating and Number of Reviews extraction
-            # These are often found together or close by in the HTML.
-            rating_review_area = card.select_one('div[data-testid="gig-rating"], span[class*="rating"], div[class*="rating"]')
-            if rating_review_area:
-                rating_element = rating_review_area.select_one('span[data-testid="star-rating-score"], span.rating-score, b') # 'b' tag for bolded rating
-                if rating_element:
-                    gig_info["rating"] = clean_rating(rating_element.text.strip())
-                else:
-                    logger.warning(f"[{card_identifier}] Rating score not found within designated rating area.")
-
-                review_count_element = rating_review_area.select_one('span[data-testid="review-count"], span.rating-count, span[class*="reviews"]')
-                if review_count_element:
-                    gig_info["num_reviews"] = clean_reviews(review_count_element.text.strip())
-                else:
-                    logger.warning(f"[{card_identifier}] Review count not found within designated rating area.")
-            else: 
-                # Fallback if a combined rating/review area isn't found.
-                rating_element = card.select_one('span[data-testid="star-rating-score"], span.rating-score, b[class*="rating"]')
-                if rating_element:
-                    gig_info["rating"] = clean_rating(rating_element.text.strip())
-                else:
-                    logger.warning(f"[{card_identifier}] Rating score not found (fallback search).")
-
-                review_count_element = card.select_one('span[data-testid="review-count"], span.rating-count, span[class*="reviews"]')
-                if review_count_element:
-                    gig_info["num_reviews"] = clean_reviews(review_count_element.text.strip())
-                else:
-                    gig_info["num_reviews"] = "0" # Assume 0 reviews if not found.
-
-            gigs_data.append(gig_info)
+            gig_info = _extract_card_fields(card, card_identifier)
         except Exception as e:
             # Log any error during parsing of a single card and add placeholder data.
             logger.error(f"[{card_identifier}] Error parsing a gig card: {e}", exc_info=True)
             gigs_data.append({ # Append placeholder to maintain row count if needed downstream.
-                "title": "Error parsing card", "seller_name": "Error", "seller_level": "Error",
+                "title": "Error parsing card", "seller_name": "Error", "seller_level": "Error", "seller_country": "Error",
                 "price": "Error", "num_reviews": "Error", "rating": "Error", "gig_url": "Error"
             })
-            
+            continue
+        if gig_info is None:
+            logger.debug(f"[{card_identifier}] No gig fields found in card; skipping it.")
+            continue
+        gigs_data.append(gig_info)
+
     if not gigs_data and gig_cards: 
         # This case means cards were identified by selectors, but no data was extracted from any of them.
         logger.warning("Gig cards were found, but no data could be extracted from any of them. CSS Selectors might be outdated or page structure is vastly different.")
@@ -269,56 +504,45 @@ def parse_gigs(html_content: str) -> list[dict]:
     logger.info(f"Successfully parsed {len(gigs_data)} gigs from the page content.")
     return gigs_data
 
-def clean_price(price_str: str) -> str | None:
+def clean_gig_fields(data: list[dict]) -> list[dict]:
     """
-    Extracts a numerical string from a price string (e.g., "$10.50" -> "10.50").
+    Cleans the raw price, rating and review count strings of all gigs in one vectorized pass.
 
-    Args:
-        price_str: The raw price string.
-
-    Returns:
-        The cleaned numerical price string, or None if no numerical part is found.
-    """
-    if not price_str: return None
-    import re # Local import for utility function
-    match = re.search(r'[\d\.,]+', price_str) # Finds sequences of digits, dots, or commas
-    return match.group(0).replace(',', '') if match else None # Removes commas for consistency
-
-def clean_reviews(reviews_str: str) -> str | None:
-    """
-    Cleans review count string (e.g., "(1.2k)" -> "1200", "25" -> "25").
+    parse_gigs keeps these fields as scraped (e.g. "$1,250", "4.9", "(1.2k)"). This converts them
+    to plain numeric strings (e.g. "1250", "4.9", "1200") using pandas string operations over the
+    whole list, instead of a Python function call per field per gig.
 
     Args:
-        reviews_str: The raw review count string.
+        data: A list of gig dictionaries as returned by parse_gigs.
 
     Returns:
-        The cleaned review count as a string, or "0" if parsing fails.
-    """
-    if not reviews_str: return None
-    import re # Local import
-    reviews_str = reviews_str.lower().replace('(', '').replace(')', '').replace(',', '')
-    match = re.search(r'([\d\.]+)(k?)', reviews_str) # Looks for number, optionally followed by 'k'
-    if match:
-        num = float(match.group(1))
-        if match.group(2) == 'k': # If 'k' is present, multiply by 1000
-            return str(int(num * 1000))
-        return str(int(num))
-    return "0" # Default to "0" if no number found
-
-def clean_rating(rating_str: str) -> str | None:
+        A new list of gig dictionaries. Prices and ratings with no numerical part become None;
+        non-empty review counts with no numerical part become "0". Error placeholder rows are
+        left unchanged.
     """
-    Cleans rating string to ensure it's a numerical value (e.g., "4.9 stars" -> "4.9").
+    if not data:
+        return data
+    df = pd.DataFrame.from_records(data, columns=_CSV_COLUMNS)
+    parsed_rows = df["title"].ne("Error parsing card") # Skip placeholders added for cards that failed to parse.
 
-    Args:
-        rating_str: The raw rating string.
+    # "$1,250" -> "1250"
+    price = df["price"].str.extract(_PRICE_RE, expand=False).str.replace(',', '', regex=False)
+    # "4.9 stars" -> "4.9"
+    rating = df["rating"].str.extract(_RATING_RE, expand=False)
+    # "(1.2k)" -> "1200", "(25)" -> "25"
+    reviews_str = df["num_reviews"].str.lower().str.replace(_REVIEWS_STRIP_RE, '', regex=True)
+    reviews_match = reviews_str.str.extract(_REVIEWS_RE)
+    reviews_num = pd.to_numeric(reviews_match[0], errors='coerce')
+    reviews_num = reviews_num.where(reviews_match[1].ne('k'), reviews_num * 1000)
+    reviews = reviews_num.dropna().astype(int).astype(str).reindex(df.index)
+    reviews = reviews.where(reviews.notna() | reviews_str.isna() | reviews_str.eq(''), "0") # Default to "0" if no number found
 
-    Returns:
-        The cleaned rating string, or None if no numerical part is found.
-    """
-    if not rating_str: return None
-    import re # Local import
-    match = re.search(r'[\d\.]+', rating_str) # Finds sequences of digits or dots
-    return match.group(0) if match else None
+    df.loc[parsed_rows, "price"] = price[parsed_rows]
+    df.loc[parsed_rows, "rating"] = rating[parsed_rows]
+    df.loc[parsed_rows, "num_reviews"] = reviews[parsed_rows]
+    # Convert pandas' missing values back to None so they serialize as empty CSV cells / JSON null.
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict('records')
 
 def ensure_output_directory_exists():
     """
@@ -340,67 +564,453 @@ def ensure_output_directory_exists():
         logger.info(f"Output directory '{OUTPUT_DIR}' already exists.")
 
 
-def save_to_csv(data: list[dict], base_filename: str, keyword: str):
+def save_to_csv(data: list[dict], base_filename: str, run_tag: str):
     """
     Saves the provided data to a CSV file.
 
-    The filename will include the base_filename, keyword, and a timestamp.
+    The filename will include the base_filename and the run_tag (keyword and timestamp).
     Data is saved in the directory specified by the OUTPUT_DIR constant.
 
     Args:
         data: A list of dictionaries to save.
         base_filename: The base name for the output file (e.g., "fiverr_gigs").
-        keyword: The keyword used for scraping, included in the filename.
+        run_tag: The "<sanitized_keyword>_<timestamp>" suffix shared by all output files of this run.
     """
     if not data:
         logger.info("No data provided to save_to_csv. Skipping file creation.")
         return
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    sanitized_keyword = keyword.replace(" ", "_").lower() # Basic sanitization for filename
-    filename = os.path.join(OUTPUT_DIR, f"{base_filename}_{sanitized_keyword}_{timestamp}.csv")
+    filename = os.path.join(OUTPUT_DIR, f"{base_filename}_{run_tag}.csv")
     
     try:
-        df = pd.DataFrame(data)
-        # Define a consistent column order for the CSV.
-        column_order = ["title", "seller_name", "seller_level", "seller_country", "price", "rating", "num_reviews", "gig_url"]
-        # Filter to only include columns that are actually present in the DataFrame to avoid errors.
-        df_columns = [col for col in column_order if col in df.columns]
-        
-        df.to_csv(filename, index=False, encoding='utf-8', columns=df_columns)
+        # Write rows straight from the dicts; the schema is fixed, so there's nothing for a DataFrame to infer.
+        # parse_gigs always emits every key in _CSV_COLUMNS, so no per-save column filtering is needed.
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=_CSV_COLUMNS, extrasaction='ignore', quoting=csv.QUOTE_MINIMAL)
+            writer.writeheader()
+            writer.writerows(data)
         logger.info(f"Successfully saved {len(data)} gigs to CSV: {filename}")
     except Exception as e:
         logger.error(f"Error saving data to CSV file '{filename}': {e}", exc_info=True)
 
-def save_to_json(data: list[dict], base_filename: str, keyword: str):
+def save_to_json(data: list[dict], base_filename: str, run_tag: str):
     """
     Saves the provided data to a JSON file.
 
-    The filename will include the base_filename, keyword, and a timestamp.
+    The filename will include the base_filename and the run_tag (keyword and timestamp).
     Data is saved in the directory specified by the OUTPUT_DIR constant.
-    JSON is saved in a human-readable format (indented).
+    JSON is saved in a human-readable format (indented), using orjson when it is installed.
 
     Args:
         data: A list of dictionaries to save.
         base_filename: The base name for the output file (e.g., "fiverr_gigs").
-        keyword: The keyword used for scraping, included in the filename.
+        run_tag: The "<sanitized_keyword>_<timestamp>" suffix shared by all output files of this run.
     """
     if not data:
         logger.info("No data provided to save_to_json. Skipping file creation.")
         return
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    sanitized_keyword = keyword.replace(" ", "_").lower() # Basic sanitization for filename
-    filename = os.path.join(OUTPUT_DIR, f"{base_filename}_{sanitized_keyword}_{timestamp}.json")
+    filename = os.path.join(OUTPUT_DIR, f"{base_filename}_{run_tag}.json")
 
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4) # indent=4 for pretty printing
+        if orjson is not None:
+            # orjson returns UTF-8 encoded bytes, so the file is opened in binary mode.
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2) # indent=2 to match orjson's pretty printing
         logger.info(f"Successfully saved {len(data)} gigs to JSON: {filename}")
     except Exception as e:
         logger.error(f"Error saving data to JSON file '{filename}': {e}", exc_info=True)
 
 
+def build_chrome_options(user_agent: str) -> Options:
+    """
+    Builds the Chrome options used for every WebDriver instance (headless, fixed window size, given User-Agent,
+    no image loading, 'eager' page load strategy).
+
+    Args:
+        user_agent: The User-Agent string the browser should present.
+
+    Returns:
+        A configured selenium Options object.
+    """
+    options = Options()
+    options.add_argument("--headless") # Run Chrome in headless mode (no GUI).
+    options.add_argument("--disable-gpu") # Recommended for headless mode.
+    options.add_argument("--window-size=1920x1080") # Specify window size.
+    options.add_argument(f"user-agent={user_agent}")
+    # parse_gigs only reads the HTML, so skip downloading images (most of a results page's weight).
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2
+    })
+    # Return from driver.get() at DOMContentLoaded; get_page_html then waits for the gig cards themselves.
+    options.page_load_strategy = 'eager'
+    return options
+
+def _read_pinned_chromedriver_path() -> str | None:
+    try:
+        with open(CHROMEDRIVER_PATH_FILE, encoding='utf-8') as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    # Only trust the pinned path if the binary is still there and runnable.
+    if path and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+def _pin_chromedriver_path(path: str):
+    # Workers only re-pin under _chromedriver_refresh_lock; the per-process temp file and atomic
+    # os.replace() additionally keep a reader from ever seeing a partially written path.
+    tmp_path = f"{CHROMEDRIVER_PATH_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(path)
+        os.replace(tmp_path, CHROMEDRIVER_PATH_FILE)
+    except OSError as e:
+        logger.warning(f"Could not save ChromeDriver path to '{CHROMEDRIVER_PATH_FILE}': {e}")
+
+def get_chromedriver_path(refresh: bool = False) -> str:
+    """
+    Returns the ChromeDriver binary path.
+
+    The path is memoized per process and pinned to CHROMEDRIVER_PATH_FILE, so later runs
+    skip ChromeDriverManager (and its version check against the download CDN) entirely
+    while the pinned binary still exists.
+
+    Args:
+        refresh: If True, ignore the memoized and pinned paths and resolve the driver
+                 with ChromeDriverManager again.
+
+    Returns:
+        The filesystem path to the ChromeDriver binary.
+    """
+    global _chromedriver_path
+    if not refresh:
+        if _chromedriver_path is not None:
+            return _chromedriver_path
+        pinned_path = _read_pinned_chromedriver_path()
+        if pinned_path:
+            logger.info(f"Using pinned ChromeDriver at {pinned_path}")
+            _chromedriver_path = pinned_path
+            return _chromedriver_path
+
+    # Installs or uses cached ChromeDriver.
+    _chromedriver_path = ChromeDriverManager().install()
+    _pin_chromedriver_path(_chromedriver_path)
+    return _chromedriver_path
+
+def _refresh_chromedriver_path(failed_path: str | None) -> str:
+    """
+    Resolves the ChromeDriver path again after `failed_path` failed to start a driver.
+
+    Runs under the lock shared by the pool workers, so only one of them at a time runs
+    ChromeDriverManager and re-pins the path. A worker that waited on the lock picks up the
+    path another worker has just pinned instead of resolving it again.
+
+    Args:
+        failed_path: The ChromeDriver path that failed to start a driver.
+
+    Returns:
+        The filesystem path to the ChromeDriver binary.
+    """
+    global _chromedriver_path
+    with _chromedriver_refresh_lock or nullcontext():
+        pinned_path = _read_pinned_chromedriver_path()
+        if pinned_path and pinned_path != failed_path:
+            logger.info(f"Using ChromeDriver at {pinned_path}, re-resolved by another worker.")
+            _chromedriver_path = pinned_path
+            return _chromedriver_path
+        return get_chromedriver_path(refresh=True)
+
+def create_driver() -> webdriver.Chrome:
+    """
+    Starts a new headless Chrome WebDriver with a randomly chosen User-Agent.
+
+    If the driver fails to start, the ChromeDriver path is resolved again (the pinned binary
+    may no longer match the installed Chrome) and startup is retried once.
+
+    Returns:
+        An initialized Selenium WebDriver instance.
+
+    Raises:
+        WebDriverException: If Chrome or ChromeDriver fails to start.
+    """
+    selected_user_agent = random.choice(USER_AGENTS) # Pick a random User-Agent per browser.
+    logger.info(f"Initializing WebDriver in process {os.getpid()} with User-Agent: {selected_user_agent}")
+    options = build_chrome_options(selected_user_agent)
+    try:
+        driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
+    except WebDriverException as e:
+        logger.warning(f"WebDriver failed to start with ChromeDriver at {_chromedriver_path}; resolving it again. Error: {e}")
+        driver = webdriver.Chrome(service=Service(_refresh_chromedriver_path(_chromedriver_path)), options=options)
+    logger.info("WebDriver initialized successfully.")
+    return driver
+
+class BrowserPool:
+    """
+    A pool of reusable headless Chrome WebDriver instances.
+
+    Drivers are started lazily, up to `size` at once, and handed out via the `acquire()`
+    context manager, so the browser startup cost is paid once rather than per page.
+    A driver that has served `max_uses` fetches is quit and replaced with a fresh one, and a driver
+    whose `with` block raised is quit and dropped, so a dead session or crashed Chrome is never reused.
+    """
+
+    def __init__(self, size: int = POOL_SIZE, max_uses: int = MAX_USES_PER_INSTANCE):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.Queue()
+        self._uses = {} # Maps each live driver to the number of fetches it has served.
+        self._starting = 0 # Number of drivers currently being started.
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self):
+        """
+        Checks out a driver for the duration of the `with` block.
+
+        The driver is released back to the pool when the block exits cleanly. If the block raises,
+        the driver is discarded instead and a fresh one is started the next time one is needed.
+
+        Yields:
+            A Selenium WebDriver instance.
+
+        Raises:
+            WebDriverException: If a new driver has to be started and fails to start.
+        """
+        driver = self._checkout()
+        try:
+            yield driver
+        except BaseException:
+            logger.warning("Discarding WebDriver after a failed fetch.")
+            self._quit(driver)
+            raise
+        self.release(driver)
+
+    def _checkout(self) -> webdriver.Chrome:
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                # Reserve a slot while starting the driver so concurrent callers don't exceed `size`.
+                can_start = len(self._uses) + self._starting < self.size
+                if can_start:
+                    self._starting += 1
+            if can_start:
+                break
+            # Pool is full; wait for another caller to release a driver, re-checking periodically
+            # in case a discarded driver freed its slot instead.
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+        try:
+            driver = create_driver()
+        except Exception:
+            with self._lock:
+                self._starting -= 1
+            raise
+        with self._lock:
+            self._starting -= 1
+            self._uses[driver] = 0
+        return driver
+
+    def release(self, driver: webdriver.Chrome):
+        """
+        Returns a driver to the pool, replacing it if it has reached `max_uses`.
+
+        Args:
+            driver: A driver previously obtained from `acquire()`.
+        """
+        with self._lock:
+            self._uses[driver] += 1
+            uses = self._uses[driver]
+        if uses < self.max_uses:
+            self._idle.put(driver)
+            return
+
+        logger.info(f"WebDriver has served {uses} fetches; replacing it with a fresh instance.")
+        self._quit(driver)
+        try:
+            replacement = create_driver()
+        except WebDriverException as e:
+            logger.error(f"Failed to start a replacement WebDriver: {e}", exc_info=True)
+            return
+        with self._lock:
+            self._uses[replacement] = 0
+        self._idle.put(replacement)
+
+    def close(self):
+        """Quits every idle driver in the pool."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+
+    def _quit(self, driver: webdriver.Chrome):
+        with self._lock:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.warning(f"Error while quitting WebDriver: {e}")
+
+def _init_worker(driver_path: str, force_rescrape: bool, seen_fingerprints, fingerprint_lock, chromedriver_refresh_lock):
+    """
+    Pool initializer that sets up a BrowserPool for the current worker process.
+
+    Browsers are started lazily on first use, so a worker that only serves cached pages never
+    starts one. The pool is registered to be closed when the worker exits (on pool.close()/join()),
+    which quits its drivers.
+
+    Args:
+        driver_path: Path to the ChromeDriver binary, resolved once by the parent process.
+        force_rescrape: If True, ignore cached pages and always fetch from Fiverr.
+        seen_fingerprints: A Manager dict shared by all workers, mapping page fingerprints to
+                           the lowest page number seen with them.
+        fingerprint_lock: A Manager lock guarding updates to seen_fingerprints.
+        chromedriver_refresh_lock: A Manager lock serializing ChromeDriver re-resolution, so a stale
+                                   pinned driver is not re-downloaded by every worker at once.
+    """
+    global _chromedriver_path, _browser_pool, _force_rescrape, _seen_fingerprints, _fingerprint_lock
+    global _chromedriver_refresh_lock
+    _chromedriver_path = driver_path
+    _chromedriver_refresh_lock = chromedriver_refresh_lock
+    _force_rescrape = force_rescrape
+    _seen_fingerprints = seen_fingerprints
+    _fingerprint_lock = fingerprint_lock
+    _browser_pool = BrowserPool()
+    Finalize(None, _browser_pool.close, exitpriority=10)
+
+def scrape_page(args: tuple[str, int]) -> tuple[int, list[dict] | None, str | None]:
+    """
+    Fetches and parses one search results page.
+
+    The page is served from the on-disk cache when a fresh copy exists (unless --force-rescrape
+    was given). Otherwise a plain HTTP request is tried first, and used if parse_gigs finds gigs in it
+    (or it shows Fiverr's "no results" message); if not, the page is fetched using a driver from the
+    worker's BrowserPool. Fetched pages are cached if they contain gigs.
+    Pages whose results match a lower-numbered page already seen this run (e.g. Fiverr serving the
+    same generic results again) are not parsed a second time.
+
+    Args:
+        args: A (keyword, page_number) tuple, packed as a single argument for Pool.imap_unordered.
+
+    Returns:
+        A (page_number, gigs, fingerprint) tuple. gigs is the list returned by parse_gigs, an empty
+        list if the page duplicates a lower-numbered page, or None if the page could not be fetched.
+        fingerprint is the page's page_fingerprint (None if it has none or was not fetched), so the
+        caller can drop a page whose content a lower page turned out to share after it was parsed.
+    """
+    keyword, page_number = args
+    url = build_search_url(keyword, page_number)
+    html_content = None if _force_rescrape else load_cached_html(url)
+    if html_content is not None:
+        logger.info(f"Using cached HTML for page {page_number} of keyword '{keyword}'.")
+        fingerprint = page_fingerprint(html_content)
+        if _is_duplicate_page(fingerprint, keyword, page_number):
+            return page_number, [], fingerprint
+        return page_number, parse_gigs(html_content), fingerprint
+
+    if page_number > 1:
+        # Jittered polite delay so concurrent workers don't hit Fiverr at the same instant.
+        sleep_duration = random.uniform(MIN_INTER_PAGE_DELAY, MAX_INTER_PAGE_DELAY)
+        logger.info(f"Waiting {sleep_duration:.2f} seconds before fetching page {page_number}...")
+        time.sleep(sleep_duration)
+
+    logger.info(f"Processing page {page_number} for keyword '{keyword}'...")
+    # Fast path: if the server-rendered HTML already has the gig cards, there's no need for a browser.
+    # The cheap regex check skips parsing pages that clearly have no cards; the page is only used
+    # (and cached) if parse_gigs actually finds gigs in it.
+    fast_html = _fetch_fast(url)
+    if fast_html and _GIG_CARD_RE.search(fast_html):
+        fingerprint = page_fingerprint(fast_html)
+        if _is_duplicate_page(fingerprint, keyword, page_number):
+            store_cached_html(url, fast_html)
+            return page_number, [], fingerprint
+        gigs_on_page = parse_gigs(fast_html)
+        if gigs_on_page:
+            logger.info(f"Fetched page {page_number} of keyword '{keyword}' without a browser.")
+            store_cached_html(url, fast_html)
+            return page_number, gigs_on_page, fingerprint
+        logger.info(f"Plain HTTP fetch of page {page_number} had gig card markup but no gigs; falling back to Selenium.")
+    elif fast_html and NO_RESULTS_TEXT in fast_html:
+        logger.info(f"No results for page {page_number} of keyword '{keyword}' (plain HTTP fetch).")
+        return page_number, [], None
+    else:
+        logger.info(f"Plain HTTP fetch gave no gig cards for page {page_number}; falling back to Selenium.")
+
+    try:
+        with _browser_pool.acquire() as driver:
+            # Fetch HTML for the page. Retries are handled by the decorator.
+            html_content = get_page_html(driver, keyword, page_number)
+    except Exception as e:
+        # This catches driver startup failures, or the exception if all retries in get_page_html fail.
+        logger.error(f"Failed to get HTML for page {page_number} of keyword '{keyword}' after all retries: {e}", exc_info=True)
+        return page_number, None, None
+
+    if not html_content:
+        return page_number, None, None
+
+    fingerprint = page_fingerprint(html_content)
+    if _is_duplicate_page(fingerprint, keyword, page_number):
+        store_cached_html(url, html_content) # Has gig title links, so it's a rendered results page.
+        return page_number, [], fingerprint
+    gigs_on_page = parse_gigs(html_content)
+    # Only cache pages with gigs: "no results" / error pages, and pages that never finished rendering
+    # (e.g. a bot challenge after the wait timed out), may be transient and should be fetched again.
+    if gigs_on_page:
+        store_cached_html(url, html_content)
+    return page_number, gigs_on_page, fingerprint
+
+def _is_duplicate_page(fingerprint: str | None, keyword: str, page_number: int) -> bool:
+    """
+    Records the page's fingerprint for this run, returning True if a lower page already has it.
+
+    The lowest page number seen with a fingerprint is kept, whichever worker finishes first, so a
+    later page never displaces page 1 from the results.
+
+    Args:
+        fingerprint: The page's page_fingerprint. Pages without one are never treated as duplicates.
+        keyword: The search keyword (for logging).
+        page_number: The page number claiming the fingerprint.
+
+    Returns:
+        True if the page's results repeat a lower-numbered page seen this run.
+    """
+    if fingerprint is None:
+        return False
+    # Read and update under the lock so two workers can't both claim a fingerprint as the lowest page.
+    with _fingerprint_lock:
+        first_page = _seen_fingerprints.get(fingerprint)
+        if first_page is None or page_number <= first_page:
+            _seen_fingerprints[fingerprint] = page_number
+            return False
+    logger.info(f"Page {page_number} for keyword '{keyword}' has the same results as page {first_page}; skipping parse.")
+    return True
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses command-line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Scrape gig listings from Fiverr search results.")
+    parser.add_argument("--force-rescrape", action="store_true",
+                        help=f"Ignore cached pages (kept for {CACHE_TTL_SECONDS // 3600} hours) and fetch every page from Fiverr again.")
+    parser.add_argument("--refresh-driver", action="store_true",
+                        help="Resolve ChromeDriver with webdriver-manager again instead of reusing the path saved by a previous run.")
+    parser.add_argument("--format", choices=["csv", "json", "both"], default="both",
+                        help="Output file format(s) to write (default: both).")
+    return parser.parse_args()
+
 def main():
     """
     Main function to orchestrate the Fiverr gig scraping process.
@@ -408,15 +1018,17 @@ def main():
     Steps:
     1. Sets up logging and ensures the output directory exists.
     2. Defines search parameters (keyword, max pages).
-    3. Initializes the Selenium WebDriver with configured options (headless, user-agent).
-    4. Iterates through search result pages for the given keyword:
-        a. Fetches HTML content for each page, with retries for robustness.
-        b. Parses gig data from the HTML.
-        c. Appends extracted gigs to a master list.
-        d. Implements delays between page requests.
-    5. After scraping, saves all collected gig data to CSV and JSON files.
-    6. Cleans up by closing the WebDriver.
+    3. Resolves the ChromeDriver binary once and starts a pool of worker processes,
+       each with its own BrowserPool of reusable headless Chrome WebDrivers.
+    4. Distributes the search result pages for the given keyword across the workers:
+        a. Each worker fetches HTML for its page (or loads it from the page cache), with retries for robustness.
+        b. Each worker parses gig data from the HTML.
+        c. Results are collected as they arrive and combined in page order.
+    5. After scraping, cleans price/rating/review fields in one pass and saves all
+       collected gig data to CSV and/or JSON files (per --format).
+    6. Cleans up by closing the pool, which closes each worker's BrowserPool.
     """
+    args = parse_arguments()
     logger.info("--- Fiverr Scraper Started ---")
     
     # --- Setup Phase ---
@@ -428,76 +1040,66 @@ def main():
         return # Exit if output directory can't be made or accessed.
 
     search_keyword = "python developer" # Keyword to search on Fiverr.
+    sanitized_keyword = search_keyword.replace(" ", "_").lower() # Basic sanitization for output filenames
+    # Computed once so the CSV and JSON files of a run always share the same timestamp.
+    run_tag = f"{sanitized_keyword}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     # MAX_PAGES_TO_SCRAPE is now a global constant.
     
     logger.info(f"Target keyword: '{search_keyword}', Max pages to scrape: {MAX_PAGES_TO_SCRAPE}")
 
-    # Configure Selenium WebDriver options
-    options = Options()
-    options.add_argument("--headless") # Run Chrome in headless mode (no GUI).
-    options.add_argument("--disable-gpu") # Recommended for headless mode.
-    options.add_argument("--window-size=1920x1080") # Specify window size.
-    selected_user_agent = random.choice(USER_AGENTS) # Pick a random User-Agent.
-    options.add_argument(f"user-agent={selected_user_agent}")
-    logger.info(f"Using User-Agent for this session: {selected_user_agent}")
-
-    driver = None
-    all_gigs_data = []
-    pages_actually_scraped = 0
+    gigs_by_page = {}
     
     # --- WebDriver Initialization and Scraping Phase ---
     try:
-        logger.info("Initializing WebDriver...")
-        # Installs or uses cached ChromeDriver.
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        logger.info("WebDriver initialized successfully.")
-        
-        # Pagination loop
-        for page_num in range(1, MAX_PAGES_TO_SCRAPE + 1):
-            logger.info(f"Processing page {page_num} for keyword '{search_keyword}'...")
+        # Resolved once here so workers don't race on the ChromeDriver download.
+        driver_path = get_chromedriver_path(refresh=args.refresh_driver)
+        num_workers = min(WORKER_PROCESSES, MAX_PAGES_TO_SCRAPE)
+        logger.info(f"Starting {num_workers} worker process(es)...")
+        with multiprocessing.Manager() as manager:
+            seen_fingerprints = manager.dict() # Lets workers skip parsing pages that repeat a lower page.
+            pool = multiprocessing.Pool(processes=num_workers, initializer=_init_worker,
+                                        initargs=(driver_path, args.force_rescrape, seen_fingerprints, manager.Lock(), manager.Lock()))
+            fingerprints_by_page = {}
             try:
-                # Fetch HTML for the current page. Retries are handled by the decorator.
-                html_content = get_page_html(driver, search_keyword, page_num)
-            except Exception as e: 
-                # This catches the exception if all retries in get_page_html fail.
-                logger.error(f"Failed to get HTML for page {page_num} of keyword '{search_keyword}' after all retries: {e}", exc_info=True)
-                html_content = None # Ensure html_content is None to stop further processing for this page.
-
-            if html_content:
-                # Parse gigs from the fetched HTML.
-                gigs_on_page = parse_gigs(html_content)
-                if gigs_on_page:
-                    all_gigs_data.extend(gigs_on_page)
-                    logger.info(f"Extracted {len(gigs_on_page)} gigs from page {page_num}.")
-                else:
-                    # No gigs found on this page.
-                    logger.info(f"No gigs found or parsed on page {page_num}. This might be the last page or an issue with parsing for this page.")
-                    # If not the first page, and no gigs found, assume it's the end of results.
-                    if page_num > 1: 
-                        logger.info(f"Assuming end of results at page {page_num} as no gigs were parsed.")
-                        pages_actually_scraped = page_num 
-                        break 
-            else:
-                # HTML content was None, meaning fetching failed definitively for this page.
-                logger.error(f"Failed to retrieve HTML for page {page_num} (content was None). Stopping pagination for this keyword.")
-                pages_actually_scraped = page_num 
-                break 
-            
-            pages_actually_scraped = page_num # Update count after successful processing of a page.
-            # Polite delay before fetching the next page, if not the last page.
-            if page_num < MAX_PAGES_TO_SCRAPE:
-                sleep_duration = random.uniform(MIN_INTER_PAGE_DELAY, MAX_INTER_PAGE_DELAY)
-                logger.info(f"Waiting {sleep_duration:.2f} seconds before fetching next page...")
-                time.sleep(sleep_duration)
-        
-        logger.info(f"Scraping finished. Attempted to scrape {pages_actually_scraped} page(s). Total gigs collected: {len(all_gigs_data)}.")
+                tasks = [(search_keyword, page_num) for page_num in range(1, MAX_PAGES_TO_SCRAPE + 1)]
+                for page_num, gigs_on_page, fingerprint in pool.imap_unordered(scrape_page, tasks):
+                    if gigs_on_page is None:
+                        # HTML content was None, meaning fetching failed definitively for this page.
+                        logger.error(f"Failed to retrieve HTML for page {page_num} (content was None).")
+                        continue
+                    if gigs_on_page:
+                        logger.info(f"Extracted {len(gigs_on_page)} gigs from page {page_num}.")
+                    else:
+                        # No gigs found on this page.
+                        logger.info(f"No gigs found or parsed on page {page_num}. This might be past the last page or an issue with parsing for this page.")
+                    gigs_by_page[page_num] = gigs_on_page
+                    fingerprints_by_page[page_num] = fingerprint
+            finally:
+                # close()/join() rather than terminate() so each worker gets to close its BrowserPool.
+                pool.close()
+                pool.join()
+
+            # A page parsed before a lower page with the same results arrived is dropped here, so the
+            # lowest page always wins regardless of which worker finished first.
+            for page_num, fingerprint in fingerprints_by_page.items():
+                first_page = seen_fingerprints.get(fingerprint) if fingerprint else None
+                if first_page is not None and first_page < page_num and gigs_by_page[page_num]:
+                    logger.info(f"Page {page_num} has the same results as page {first_page}; dropping its gigs.")
+                    gigs_by_page[page_num] = []
+
+        # Combine in page order, since pages complete in whatever order the workers finish them.
+        all_gigs_data = [gig for page_num in sorted(gigs_by_page) for gig in gigs_by_page[page_num]]
+        logger.info(f"Scraping finished. Successfully scraped {len(gigs_by_page)} of {MAX_PAGES_TO_SCRAPE} page(s). Total gigs collected: {len(all_gigs_data)}.")
         
         # --- Data Saving Phase ---
         if all_gigs_data:
             logger.info(f"Total of {len(all_gigs_data)} gigs collected. Preparing to save...")
-            save_to_csv(all_gigs_data, "fiverr_gigs", search_keyword)
-            save_to_json(all_gigs_data, "fiverr_gigs", search_keyword)
+            all_gigs_data = clean_gig_fields(all_gigs_data)
+            # Only serialize the formats that were asked for.
+            if args.format in ("csv", "both"):
+                save_to_csv(all_gigs_data, "fiverr_gigs", run_tag)
+            if args.format in ("json", "both"):
+                save_to_json(all_gigs_data, "fiverr_gigs", run_tag)
             logger.info("Data saving process completed.")
         else:
             logger.warning("No gigs were collected from any page. No files will be saved.")
@@ -509,11 +1111,6 @@ def main():
         # Catch any other unexpected critical errors during the main process.
         logger.critical(f"An unexpected critical error occurred in the main scraping process: {e}", exc_info=True)
     finally:
-        # --- Cleanup Phase ---
-        if driver:
-            logger.info("Closing WebDriver...")
-            driver.quit()
-            logger.info("WebDriver closed.")
         logger.info("--- Fiverr Scraper Finished ---")
 
 if __name__ == "__main__":